@@ -4,12 +4,13 @@
 BibTeX check on missing fields and consistent name conventions (no BibTeX validator),
 especially developed for requirements in Computer Science.
 """
+import os
 import string
 import re
 import sys
 from optparse import OptionParser
+from operator import itemgetter
 from datetime import datetime
-import dateutil.parser
 from unidecode import unidecode
 
 
@@ -53,8 +54,35 @@ requiredFields = {
 
 ####################################################################
 
+# cited keys in aux files, e.g. \citation{key1,key2}
+_CITE_RE = re.compile(r'\\citation\{([^}]*)\}')
+
+# ISO 8601 dates of reduced precision, e.g. 2020 or 2020-01
+_REDUCED_DATE_RE = re.compile(r'^\d{4}(-(0[1-9]|1[0-2]))?$')
+
+# characters stripped from titles
+_BRACE_TRANS = str.maketrans('', '', '{}')
+
+# umlauts transcribed and characters dropped when matching author names against bib keys
+_UMLAUT_TRANS = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'Ä': 'Ae', 'Ö': 'Oe', 'Ü': 'Ue'})
+_NAME_STRIP_TRANS = str.maketrans('', '', " .'")
+
+# HTML of a single entry in the report
+_ENTRY_TMPL = ("<div id='{cid}' class='problem severe{sev}'>"
+               "<h2>{cid} ({ctype})</h2> "
+               "<div class='links'>{links}</div>"
+               "<div class='reference'>{title}</div>"
+               "<ul>{subs}</ul>"
+               "<form class='problem_control'><label>checked</label><input type='checkbox' class='checked'/></form>"
+               "<div class='bibtex_toggle'>Current BibTeX Entry</div>"
+               "<div class='bibtex'>{bib}</div>"
+               "</div>")
 
 #####
+# escape characters the console cannot encode instead of failing
+# (stdout may be replaced by an object without reconfigure, e.g. in IDLE or under pythonw)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(errors="backslashreplace")
 print("INFO: Python version " + str(sys.version_info[0]) + "." + str(sys.version_info[1]) + "." + str(sys.version_info[2]))
 
 # Parse options
@@ -85,20 +113,20 @@ toconsole = not options.no_console
 # Find used referenced IDs only
 used_cits = set()
 try:
-    fInAux = open(auxFile, 'r', encoding="utf8")
-    for line in fInAux:
-        if line.startswith("\\citation"):
-            citations = line.split("{")[1].rstrip("} \n").split(", ")
-            for cit in citations:
-                if cit != "":
-                    used_cits.add(cit)
-    fInAux.close()
+    with open(auxFile, 'r', encoding="utf8") as fInAux:
+        auxLines = fInAux.read().split("\n")
+    for line in auxLines:
+        match = _CITE_RE.match(line)
+        if match:
+            used_cits.update(filter(None, (cit.strip() for cit in match.group(1).split(","))))
 except IOError as e:
     print("INFO: Aux file '" + auxFile +
           "' doesn't exist -> not restricting entries")
 
 try:
-    fIn = open(bibFile, 'r', encoding="utf8")
+    # read at once; newlines are already normalized to "\n"
+    with open(bibFile, 'r', encoding="utf8") as fIn:
+        lines = fIn.read().split("\n")
 except IOError as e:
     print("ERROR: Input bib file '" + bibFile +
           "' doesn't exist or is not readable")
@@ -115,41 +143,136 @@ if configFile:
         data = json.load(config)
     requiredFields = data["requiredFields"]
 
+# Resolve type aliases and split alternative field combinations once
+# field = "author/editor"; fields might be [author, ...] or [editor, ...]
+resolvedTypes = {}
+for entryType in requiredFields:
+    resolvedType = entryType
+    visited = set()
+    while isinstance(requiredFields.get(resolvedType), str) and resolvedType not in visited:
+        visited.add(resolvedType)
+        resolvedType = requiredFields[resolvedType]
+    # aliases pointing to undefined types or into a cycle are left unresolved
+    if resolvedType in requiredFields and not isinstance(requiredFields[resolvedType], str):
+        resolvedTypes[entryType] = resolvedType
+    else:
+        print(f"WARNING: Cannot resolve alias '{requiredFields[entryType]}' of entry type {entryType}")
+requiredAlternatives = {entryType: [(field, tuple(field.split("/"))) for field in required]
+                        for entryType, required in requiredFields.items()
+                        if not isinstance(required, str)}
+
 # Go through and check all references
-completeEntry = ""
+entryLines = []
 currentId = ""
-citations = []
+# whether the current entry is cited, i.e. has to be checked
+currentActive = not used_cits or currentId in used_cits
+citations = set()
 currentType = ""
 currentArticleId = ""
 currentTitle = ""
-fields = []
+fields = set()
 problems = []
 subproblems = []
 
-counterMissingFields = 0
-counterFlawedNames = 0
-counterWrongTypes = 0
-counterNonUniqueId = 0
+# problem counters, indexed by category
+MISSING_FIELDS, FLAWED_NAMES, WRONG_TYPES, NON_UNIQUE_ID, DOCUMENT_LINK_ERRORS = range(5)
+counters = [0] * 5
+
+# valid range of years
+minyear = 1900
+maxyear = datetime.now().year + 1
+
+removePunctuationMap = str.maketrans("", "", string.punctuation)
+
+
+# Field specific checks, dispatched by field name
+
+
+def _check_author(value, currentId, subproblems):
+    # check correct author format
+    authors = value.split(" and ")
+    for a in authors:
+        if a.count(',') > 1:
+            subproblems.append("flawed name: author with more than 1 comma found '" + value + "'")
+            counters[FLAWED_NAMES] += 1
+    # check whether author name has curly braces
+    if "{" in value or "}" in value:
+        subproblems.append("authors field has curly braces {} - not needed")
+        counters[FLAWED_NAMES] += 1
+    # check whether author name is part of bibkey
+    firstAuthor = authors[0]
+    lastname, comma, _ = firstAuthor.partition(",")
+    if comma:
+        firstAuthorLastname = lastname.strip("{} ,\n")
+    else:
+        firstAuthorLastname = firstAuthor.split(" ")[-1].strip("{} ,\n")
+    firstAuthorLastname = unidecode(firstAuthorLastname.translate(_UMLAUT_TRANS)).lower().translate(_NAME_STRIP_TRANS)
+    if firstAuthorLastname not in currentId and firstAuthorLastname.replace("-", "") not in currentId:
+        subproblems.append(f"first authors last name '{firstAuthorLastname}' not part of bib-key")
+        counters[FLAWED_NAMES] += 1
+
+
+def _check_year(value, currentId, subproblems):
+    # check year is 4-digit and in valid range
+    try:
+        if not minyear < int(value) <= maxyear:
+            subproblems.append(f"year must be in range of ({minyear}, {maxyear})")
+            counters[FLAWED_NAMES] += 1
+    except ValueError as e:
+        subproblems.append(f"failed to parse year '{value}'")
+        counters[FLAWED_NAMES] += 1
+    # check year is contained in bib-key
+    if value not in currentId:
+        subproblems.append("year is not part of bib-key")
+        counters[FLAWED_NAMES] += 1
+
+
+def _check_pages(value, currentId, subproblems):
+    if value.startswith("1--"):
+        subproblems.append(f"pages '{value}' is most likey not correct: check that your reference really starts on page 1")
+
+
+def _check_urldate(value, currentId, subproblems):
+    # check urldate is iso-formatted
+    # reduced precision dates (YYYY, YYYY-MM) are not accepted by fromisoformat
+    if _REDUCED_DATE_RE.match(value):
+        return
+    try:
+        # trailing 'Z' is only understood by fromisoformat from Python 3.11 on
+        datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError as e:
+        subproblems.append(f"urldate '{value}' is not formatted according to ISO 8601")
+        counters[FLAWED_NAMES] += 1
+
+
+def _check_doi(value, currentId, subproblems):
+    # must not contain http
+    if value.startswith("http"):
+        subproblems.append("DOI '" + value + "' must not start with http - only the numeric part is sufficient")
+        counters[DOCUMENT_LINK_ERRORS] += 1
+
+
+_FIELD_HANDLERS = {
+    "author": _check_author,
+    "year": _check_year,
+    "pages": _check_pages,
+    "urldate": _check_urldate,
+    "doi": _check_doi,
+}
 
-removePunctuationMap = dict((ord(char), None) for char in string.punctuation)
 
-lineNo = 0
-for line in fIn:
-    lineNo += 1
-    line = line.strip("\n")
-    if line.startswith("@"):
+for lineNo, line in enumerate(lines, 1):
+    if not line:
+        continue
+    if line[0] == "@":
         # bib entry start
-        if currentId in used_cits or not used_cits:
-            if currentType in requiredFields:
-                # resolve type
-                while isinstance(requiredFields[currentType], str):
-                    currentType = requiredFields[currentType]
-                for field in requiredFields[currentType]:
-                    # split alternative field combinations
-                    # field = "author/editor"; fields might be [author, ...] or [editor, ...]
-                    if not any(f in fields for f in field.split("/")):
+        if currentActive:
+            if currentType in resolvedTypes:
+                currentType = resolvedTypes[currentType]
+                for field, alternatives in requiredAlternatives[currentType]:
+                    if not any(f in fields for f in alternatives):
                         subproblems.append(f"{currentType}: missing field '{field}'")
-                        counterMissingFields += 1
+                        counters[MISSING_FIELDS] += 1
             else:
                 if currentType and currentType != "comment":
                     print(f"WARNING: Ignoring unspecified entry type {currentType}")
@@ -159,422 +282,116 @@ for line in fIn:
         # check if url is given, but no urldate
         if "url" in fields and "urldate" not in fields:
             subproblems.append("missing field 'urldate' when 'url' is given")
-            counterMissingFields += 1
+            counters[MISSING_FIELDS] += 1
 
         # check if both url and doi are given
         if "url" in fields and "doi" in fields:
             subproblems.append("both 'url' and 'doi' given - only one recommended")
-            counterFlawedNames += 1
-
-        if currentId in used_cits or not used_cits:
-            cleanedTitle = currentTitle.translate(removePunctuationMap)
-            problem = "<div id='" + currentId + "' class='problem severe" + str(len(subproblems)) + "'>"
-            problem += "<h2>" + currentId + " (" + currentType + ")</h2> "
-            problem += "<div class='links'>"
-            if citeulikeUsername:
-                problem += "<a href='" + citeulikeHref + currentArticleId + "' target='_blank'>CiteULike</a>"
-            problem += " | <a href='" + scholarHref + cleanedTitle + "' target='_blank'>Scholar</a>"
-            problem += " | <a href='" + webSearchHref + cleanedTitle + "' target='_blank'>Web Search</a>"
-            problem += " | <a href='" + dblpHref + cleanedTitle + "' target='_blank'>DBLP</a>"
-            problem += "</div>"
-            problem += "<div class='reference'>" + currentTitle + "</div>"
-            problem += "<ul>"
-            for subproblem in subproblems:
-                problem += "<li>" + subproblem + "</li>"
-                if toconsole:
-                    try:
-                        print("PROBLEM: " + currentId + " - " + subproblem)
-                    except UnicodeEncodeError:
-                        print(("PROBLEM: " + currentId + " - " + subproblem).encode('utf-8'))
-            problem += "</ul>"
-            problem += "<form class='problem_control'><label>checked</label><input type='checkbox' class='checked'/></form>"
-            problem += "<div class='bibtex_toggle'>Current BibTeX Entry</div>"
-            problem += "<div class='bibtex'>" + completeEntry + "</div>"
-            problem += "</div>"
-            problems.append(problem)
-        fields = []
+            counters[FLAWED_NAMES] += 1
+
+        if currentActive:
+            if toconsole and subproblems:
+                print("".join(f"PROBLEM: {currentId} - {subproblem}\n" for subproblem in subproblems), end="")
+            # the report is the only consumer of the entry HTML
+            if htmlOutput:
+                cleanedTitle = currentTitle.translate(removePunctuationMap)
+                links = (f" | <a href='{scholarHref}{cleanedTitle}' target='_blank'>Scholar</a>"
+                         f" | <a href='{webSearchHref}{cleanedTitle}' target='_blank'>Web Search</a>"
+                         f" | <a href='{dblpHref}{cleanedTitle}' target='_blank'>DBLP</a>")
+                if citeulikeUsername:
+                    links = f"<a href='{citeulikeHref}{currentArticleId}' target='_blank'>CiteULike</a>" + links
+                completeEntry = "<br />".join(entryLines) + "<br />" if entryLines else ""
+                problems.append((currentId, _ENTRY_TMPL.format(
+                    cid=currentId, sev=len(subproblems), ctype=currentType,
+                    links=links, title=currentTitle,
+                    subs="".join(f"<li>{subproblem}</li>" for subproblem in subproblems),
+                    bib=completeEntry)))
+        fields = set()
         subproblems = []
-        currentId = line.split("{")[1].rstrip(",\n").lower().strip()
+        head, _, rest = line.partition("{")
+        currentType = head.strip("@ ").lower()
+        currentId = rest.rstrip(",\n").lower().strip()
+        currentActive = not used_cits or currentId in used_cits
         if currentId in citations:
             subproblems.append("non-unique id: '" + currentId + "'")
-            counterNonUniqueId += 1
+            counters[NON_UNIQUE_ID] += 1
         else:
-            citations.append(currentId)
-        currentType = line.split("{")[0].strip("@ ").lower()
-        completeEntry = line + "<br />"
+            citations.add(currentId)
+        entryLines = [line]
         if currentId == '':
             subproblems.append(f"line {lineNo}: missing bibkey for {currentType} found")
-            counterFlawedNames += 1
-    else:
-        # bib entry contents
-        if line != "":
-            completeEntry += line + "<br />"
-        if currentId in used_cits or not used_cits:
-            if "=" in line:
-                # bibtex is case sensitive
-                field = line.split("=")[0].strip().lower()
-                fields.append(field)
-                value = line.split("=")[1].strip("{} ,\n")
-                if value == "null":
-                    subproblems.append(f"value of field {field} is null")
-                    counterMissingFields += 1
-                if field == "author":
-                    # check correct author format
-                    authors = value.split(" and ")
-                    for a in authors:
-                        if a.count(',') > 1:
-                            subproblems.append("flawed name: author with more than 1 comma found '" + value + "'")
-                            counterFlawedNames += 1
-                    currentAuthor = filter(lambda x: not (x in "\\\"{}"), authors[0])
-                    # check whether author name has curly braces
-                    if "{" in value or "}" in value:
-                        subproblems.append("authors field has curly braces {} - not needed")
-                        counterFlawedNames += 1
-                    # check whether author name is part of bibkey
-                    firstAuthor = authors[0]
-                    if "," in firstAuthor:
-                        firstAuthorLastname = firstAuthor.split(",")[0].strip("{} ,\n")
-                    else:
-                        firstAuthorLastname = firstAuthor.split(" ")[-1].strip("{} ,\n")
-                    firstAuthorLastname = firstAuthorLastname.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
-                    firstAuthorLastname = unidecode(firstAuthorLastname).lower().replace(" ", "").replace(".", "").replace("'", "")
-                    if firstAuthorLastname not in currentId and firstAuthorLastname.replace("-", "") not in currentId:
-                        subproblems.append(f"first authors last name '{firstAuthorLastname}' not part of bib-key")
-                        counterFlawedNames += 1
-                if field == "year":
-                    # check year is 4-digit and in valid range
-                    minyear = 1900
-                    maxyear = int(datetime.now().year) + 1
-                    try:
-                        if not minyear < int(value) <= maxyear:
-                            subproblems.append(f"year must be in range of ({minyear}, {maxyear})")
-                            counterFlawedNames += 1
-                    except ValueError as e:
-                        subproblems.append(f"failed to parse year '{value}'")
-                        counterFlawedNames += 1
-                    # check year is contained in bib-key
-                    if value not in currentId:
-                        subproblems.append("year is not part of bib-key")
-                        counterFlawedNames += 1
-                if field == "pages":
-                    if value.startswith("1--"):
-                        subproblems.append(f"pages '{value}' is most likey not correct: check that your reference really starts on page 1")
-                if field == "urldate":
-                    # check urldate is iso-formatted
-                    try:
-                        urldate = dateutil.parser.parse(value)
-                    except ValueError as e:
-                        subproblems.append(f"urldate '{value}' is not formatted according to ISO 8601")
-                        counterFlawedNames += 1
-                if field == "citeulike-article-id":
-                    currentArticleId = value
-                if field == "title":
-                    currentTitle = re.sub(r'[}{]', r'', value)
-                if field == "doi":
-                    # must not contain http
-                    if value.startswith("http"):
-                        subproblems.append("DOI '" + value + "' must not start with http - only the numeric part is sufficient")
-                        counterDocumentLinkErrors += 1
-
-                ###############################################################
-                # Checks (please (de)activate/extend to your needs)
-                ###############################################################
-
-                # check if type 'proceedings' might be 'inproceedings'
-                if currentType == "proceedings" and field == "pages":
-                    subproblems.append("wrong type: maybe should be 'inproceedings' because entry has page numbers")
-                    counterWrongTypes += 1
-
-                # check if abbreviations are used in journal titles
-                if currentType == "article" and field == "journal":
-                    if "." in line:
-                        subproblems.append("flawed name: abbreviated journal title '" + value + "'")
-                        counterFlawedNames += 1
-
-            ###############################################################
-
-fIn.close()
-
-
-problemCount = counterMissingFields + counterFlawedNames + counterWrongTypes + counterNonUniqueId
+            counters[FLAWED_NAMES] += 1
+        continue
+
+    # bib entry contents
+    entryLines.append(line)
+    if not currentActive:
+        continue
+    eq = line.find("=")
+    if eq >= 0:
+        # bibtex is case sensitive
+        field = line[:eq].strip().lower()
+        fields.add(field)
+        # only the first '=' separates field and value
+        value = line[eq + 1:].strip("{} ,\n")
+        if value == "null":
+            subproblems.append(f"value of field {field} is null")
+            counters[MISSING_FIELDS] += 1
+        handler = _FIELD_HANDLERS.get(field)
+        if handler:
+            handler(value, currentId, subproblems)
+        elif field == "citeulike-article-id":
+            currentArticleId = value
+        elif field == "title":
+            currentTitle = value.translate(_BRACE_TRANS)
+
+        ###############################################################
+        # Checks (please (de)activate/extend to your needs)
+        ###############################################################
+
+        # check if type 'proceedings' might be 'inproceedings'
+        if currentType == "proceedings" and field == "pages":
+            subproblems.append("wrong type: maybe should be 'inproceedings' because entry has page numbers")
+            counters[WRONG_TYPES] += 1
+
+        # check if abbreviations are used in journal titles
+        if currentType == "article" and field == "journal":
+            if "." in line:
+                subproblems.append("flawed name: abbreviated journal title '" + value + "'")
+                counters[FLAWED_NAMES] += 1
+
+    ###############################################################
+
+
+problemCount = sum(counters)
 
 # Write out our HTML file
 if htmlOutput:
+    # static page head, kept next to the script so it is only read when a report is written
+    templateFile = os.path.join(os.path.dirname(os.path.realpath(__file__)), "report_template.html")
+    try:
+        with open(templateFile, 'r', encoding="utf8") as template:
+            htmlHead = template.read()
+    except IOError as e:
+        print("ERROR: Report template '" + templateFile +
+              "' doesn't exist or is not readable")
+        sys.exit(-1)
     html = open(htmlOutput, 'w', encoding="utf8")
-    html.write("""<!doctype html>
-<html>
-<head>
-<meta http-equiv="Content-Type" content="text/html; charset=utf-8"/>
-<title>BibTeX Check</title>
-<style>
-body {
-    font-family: Calibri, Arial, Sans;
-    padding: 10px;
-    width: 1030px;
-    margin: 10px auto;
-    border-top: 1px solid black;
-}
-
-#title {
-    width: 720px;
-    border-bottom: 1px solid black;
-}
-
-#title h1 {
-    margin: 10px 0px;
-}
-
-#title h1 a {
-    color: black;
-    text-decoration: none;
-}
-
-#control {
-    clear: both;
-}
-
-#search {
-    float: left;
-}
-
-#search input {
-    width: 300px;
-    font-size: 14pt;
-}
-
-#mode {
-    text-align: right;
-}
-
-#mode label:first-child {
-    font-weight: bold;
-}
-
-#mode input {
-    margin-left: 20px;
-}
-
-.info {
-    margin-top: 10px;
-    padding: 10px;
-    background: #FAFADD;
-    width: 250px;
-    float: right;
-    box-shadow: 1px 1px 1px 1px #ccc;
-    clear: both;
-}
-
-.info h2 {
-    font-size: 12pt;
-    padding: 0px;
-    margin: 0px;
-}
-
-.problem {
-    margin-top: 10px;
-    margin-bottom: 10px;
-    padding: 10px;
-    background: #FFBBAA;
-    counter-increment: problem;
-    width: 700px;
-    border: 1px solid #993333;
-    border-left: 5px solid #993333;
-    box-shadow: 1px 1px 1px 1px #ccc;
-    float: left;
-}
-
-.active {
-    box-shadow: 5px 5px 3px 3px #ccc;
-    position: relative;
-    top: -2px;
-}
-
-.severe0 {
-    background: #FAFAFA;
-    border: 1px solid black;
-    border-left: 5px solid black;
-}
-
-.severe1 {
-    background: #FFEEDD;
-}
-
-.severe2 {
-    background: #FFDDCC;
-}
-
-.severe3 {
-    background: #FFCCBB;
-}
-
-.problem_checked {
-    border: 1px solid #339933;
-    border-left: 5px solid #339933;
-}
-
-.problem h2:before {
-    content: counter(problem) ". "; color: gray;
-}
-
-.problem h2 {
-    font-size: 12pt;
-    padding: 0px;
-    margin: 0px;
-}
-
-.problem .links {
-    float: right;
-    position:relative;
-    top: -22px;
-}
-
-.problem .links a {
-    color: #3333CC;
-}
-
-.problem .links a:visited {
-    color: #666666;
-}
-
-.problem .reference {
-    clear: both;
-    font-size: 9pt;
-    margin-left: 20px;
-    font-style:italic;
-    font-weight:bold;
-}
-
-.problem ul {
-    clear: both;
-}
-
-.problem .problem_control {
-    float: right;
-    margin: 0px;
-    padding: 0px;
-}
-
-.problem .bibtex_toggle{
-    text-decoration: underline;
-    font-size: 9pt;
-    cursor: pointer;
-    padding-top: 5px;
-}
-
-.problem .bibtex {
-    margin-top: 5px;
-    font-family: Monospace;
-    font-size: 8pt;
-    display: none;
-    border: 1px solid black;
-    background-color: #FFFFFF;
-    padding: 5px;
-}
-</style>
-<script src="https://code.jquery.com/jquery-1.12.4.min.js"></script>
-<script>
-
-function isInProblemMode() {
-    return $('#mode_problems:checked').val() == 'problems'
-}
-
-function update() {
-    $('.problem').hide();
-    $('.problem[id*='+$('#search input').val()+']').show();
-    $('.problem .checked').each(function () {
-        if ($(this).attr('checked')) {
-            $(this).parents('.problem').addClass('problem_checked');
-        } else {
-            $(this).parents('.problem').removeClass('problem_checked');
-        }
-    });
-    if (isInProblemMode()) {
-        $('.severe0').hide();
-        $('.problem_checked').hide();
-    }
-}
-
-$(document).ready(function(){
-
-    $(".bibtex_toggle").click(function(event){
-        event.preventDefault();
-        $(this).next().slideToggle();
-    });
-
-    $('#search input').live('input', function() {
-        update();
-    });
-
-    $('#mode input').change(function() {
-        update();
-    });
-
-    $("#uncheck_button").click(function(){
-        $('.problem .checked').attr('checked',false);
-        localStorage.clear();
-        update();
-    });
-
-    $('.problem a').mousedown(function(event) {
-        $('.problem').removeClass('active');
-        $(this).parents('.problem').addClass('active');
-    });
-
-    $('.problem .checked').change(function(event) {
-        var problem = $(this).parents('.problem');
-        problem.toggleClass('problem_checked');
-        var checked = problem.hasClass('problem_checked');
-        localStorage.setItem(problem.attr('id'),checked);
-        if (checked && isInProblemMode()) {
-            problem.slideUp();
-        }
-    });
-
-    $('.problem .checked').each(function () {
-        $(this).attr('checked',localStorage.getItem($(this).parents('.problem').attr('id'))=='true');
-    });
-    update();
-});
-
-</script>
-</head>
-<body>
-<div id="title">
-<h1><a href='http://github.com/auge/BibTeX-Check'>BibTeX Check</a></h1>
-<div id="control">
-<form id="search"><input placeholder="search entry ID ..."/></form>
-<form id="mode">
-<label>show entries:</label>
-<input type = "radio"
-                 name = "mode"
-                 id = "mode_problems"
-                 value = "problems"
-                 checked = "checked" />
-          <label for = "mode_problems">problems</label>
-          <input type = "radio"
-                 name = "mode"
-                 id = "mode_all"
-                 value = "all" />
-          <label for = "mode_all">all</label>
-<input type="button" value="uncheck all" id="uncheck_button"></button>
-</form>
-<br style="clear: both; " />
-</div>
-</div>
-""")
+    html.write(htmlHead)
     html.write("<div class='info'><h2>Info</h2><ul>")
     html.write("<li>bib file: " + bibFile + "</li>")
     html.write("<li>aux file: " + auxFile + "</li>")
     html.write("<li># entries: " + str(len(problems)) + "</li>")
     html.write("<li># problems: " + str(problemCount) + "</li><ul>")
-    html.write("<li># missing fields: " + str(counterMissingFields) + "</li>")
-    html.write("<li># flawed names: " + str(counterFlawedNames) + "</li>")
-    html.write("<li># wrong types: " + str(counterWrongTypes) + "</li>")
-    html.write("<li># non-unique id: " + str(counterNonUniqueId) + "</li>")
+    html.write("<li># missing fields: " + str(counters[MISSING_FIELDS]) + "</li>")
+    html.write("<li># flawed names: " + str(counters[FLAWED_NAMES]) + "</li>")
+    html.write("<li># wrong types: " + str(counters[WRONG_TYPES]) + "</li>")
+    html.write("<li># non-unique id: " + str(counters[NON_UNIQUE_ID]) + "</li>")
+    html.write("<li># document link errors: " + str(counters[DOCUMENT_LINK_ERRORS]) + "</li>")
     html.write("</ul></ul></div>")
 
-    problems.sort()
-    for problem in problems:
+    problems.sort(key=itemgetter(0))
+    for _, problem in problems:
         html.write(problem)
     html.write("</body></html>")
     html.close()